@@ -42,11 +42,26 @@ SENSOR_TYPES = {
         "unit": "bpm",
         "icon": "mdi:heart",
     },
+    "heart_rate_variability": {
+        "name": "Heart Rate Variability",
+        "unit": "ms",
+        "icon": "mdi:heart-flash",
+    },
+    "spo2": {
+        "name": "Blood Oxygen Level",
+        "unit": "%",
+        "icon": "mdi:water-percent",
+    },
     "sleep_score": {
         "name": "Sleep Score",
         "unit": "%",
         "icon": "mdi:sleep",
     },
+    "sleep_efficiency": {
+        "name": "Sleep Efficiency",
+        "unit": "%",
+        "icon": "mdi:bed",
+    },
     "sleep_duration": {
         "name": "Sleep Duration",
         "unit": "hours",
@@ -59,6 +74,9 @@ SENSOR_TYPES = {
     },
 }
 
+# Bulky or derived attributes kept out of the recorder database
+UNRECORDED_ATTRIBUTES = frozenset({"hrv", "spo2", "efficiency", "disturbances"})
+
 # Error messages
 ERROR_AUTH = "Authentication failed"
 ERROR_CONNECTION = "Connection failed"
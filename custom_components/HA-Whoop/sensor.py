@@ -5,7 +5,6 @@ from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import (
-    SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
@@ -17,7 +16,7 @@ from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
 
-from .const import DOMAIN, SENSOR_TYPES
+from .const import DOMAIN, SENSOR_TYPES, UNRECORDED_ATTRIBUTES
 from . import WhoopDataUpdateCoordinator
 
 async def async_setup_entry(
@@ -37,6 +36,8 @@ async def async_setup_entry(
 class WhoopSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Whoop sensor."""
 
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
+
     def __init__(
         self,
         coordinator: WhoopDataUpdateCoordinator,
@@ -50,10 +51,12 @@ class WhoopSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = SENSOR_TYPES[sensor_type]["unit"]
         self._attr_icon = SENSOR_TYPES[sensor_type]["icon"]
         
-        # Set device class based on sensor type
-        if "heart_rate" in sensor_type:
-            self._attr_device_class = SensorDeviceClass.HEART_RATE
-        elif sensor_type.endswith("_score"):
+        # Only scores and the promoted recovery/sleep metrics keep statistics
+        if sensor_type.endswith("_score") or sensor_type in (
+            "heart_rate_variability",
+            "spo2",
+            "sleep_efficiency",
+        ):
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
@@ -66,8 +69,14 @@ class WhoopSensor(CoordinatorEntity, SensorEntity):
             return self.coordinator.data.get("recovery", {}).get("score")
         elif self._sensor_type == "resting_heart_rate":
             return self.coordinator.data.get("recovery", {}).get("resting_heart_rate")
+        elif self._sensor_type == "heart_rate_variability":
+            return self.coordinator.data.get("recovery", {}).get("hrv")
+        elif self._sensor_type == "spo2":
+            return self.coordinator.data.get("recovery", {}).get("spo2")
         elif self._sensor_type == "sleep_score":
             return self.coordinator.data.get("sleep", {}).get("score")
+        elif self._sensor_type == "sleep_efficiency":
+            return self.coordinator.data.get("sleep", {}).get("efficiency")
         elif self._sensor_type == "sleep_duration":
             sleep_duration = self.coordinator.data.get("sleep", {}).get("duration")
             if sleep_duration: